@@ -1,10 +1,11 @@
 """Config flow for MeshCore integration."""
 import logging
 import asyncio
+import errno
 import os
-from typing import Any, Dict, Optional
-
-import meshcore
+import random
+import socket
+from typing import Any, Dict, Optional, Tuple
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -13,6 +14,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from bleak import BleakScanner
+from bleak.exc import BleakError
 from meshcore.events import EventType
 
 from .const import (
@@ -31,6 +33,11 @@ from .const import (
     DEFAULT_BAUDRATE,
     DEFAULT_TCP_PORT,
     CONNECTION_TIMEOUT,
+    CONNECTION_ATTEMPTS,
+    CONNECTION_BACKOFF_BASE,
+    CONNECTION_BACKOFF_MAX,
+    BLE_SCAN_TIMEOUT,
+    BLE_SCAN_CACHE_TTL,
     CONF_REPEATER_SUBSCRIPTIONS,
     CONF_REPEATER_NAME,
     CONF_REPEATER_PASSWORD,
@@ -73,42 +80,109 @@ TCP_SCHEMA = vol.Schema(
     }
 )
 
-async def validate_common(api: MeshCoreAPI) -> Dict[str, Any]:
-    """Validate the user input allows us to connect to the USB device."""
-    try: 
-        # Try to connect with timeout
-        connect_success = await asyncio.wait_for(api.connect(), timeout=CONNECTION_TIMEOUT)
+class RecoverableConnectError(CannotConnect):
+    """Error to indicate a transient connection failure that is worth retrying."""
+
+# hass.data key for the BLE scan shared by all config flows. Kept out of
+# hass.data[DOMAIN], which only holds per-entry data.
+BLE_SCAN_DATA = f"{DOMAIN}_ble_scan"
+
+# Contact types that can be subscribed to as repeaters
+_REPEATER_NODE_TYPES = frozenset({NodeType.REPEATER, NodeType.ROOM_SERVER})
+
+# Transport errors that usually clear up on a second attempt
+RECOVERABLE_ERRORS = (asyncio.TimeoutError, OSError, BleakError, RecoverableConnectError)
+
+# Connect errors that retrying won't fix (bad path, no permission, port refused)
+PERMANENT_ERRNOS = frozenset({errno.ENOENT, errno.EACCES, errno.EPERM, errno.ECONNREFUSED})
+
+def _is_permanent_error(ex: Optional[Exception]) -> bool:
+    """Return True if a connect error means the settings are wrong."""
+    # gaierror is an unresolvable host name, its errno is not an errno.* code
+    if isinstance(ex, socket.gaierror):
+        return True
+    return isinstance(ex, OSError) and ex.errno in PERMANENT_ERRNOS
+
+async def _connect_and_get_info(api: MeshCoreAPI) -> Dict[str, Any]:
+    """Connect to the device and fetch its node info."""
+    # Connect and fetch node info under a single timeout
+    async with asyncio.timeout(CONNECTION_TIMEOUT):
+        connect_success = await api.connect()
         
         # Check if connection was successful
         if not connect_success or not api._mesh_core:
             _LOGGER.error("Failed to connect to device - connect() returned False")
-            raise CannotConnect("Device connection failed")
+            if _is_permanent_error(api.last_error):
+                raise CannotConnect(f"Failed to connect: {api.last_error}") from api.last_error
+            raise RecoverableConnectError("Device connection failed") from api.last_error
             
         # Get node info to verify communication
         node_info = await api._mesh_core.commands.send_appstart()
-        
-        # Validate we got meaningful info back
-        if node_info.type == EventType.ERROR:
-            _LOGGER.error("Failed to get node info - received error: %s", node_info.payload)
-            raise CannotConnect("Failed to get node info")
-            
-        # Disconnect when done
+    
+    # Validate we got meaningful info back
+    if node_info.type == EventType.ERROR:
+        _LOGGER.error("Failed to get node info - received error: %s", node_info.payload)
+        raise CannotConnect("Failed to get node info")
+    
+    # Extract and log the device information
+    device_name = node_info.payload.get('name', 'Unknown')
+    public_key = node_info.payload.get('public_key', '')
+    
+    # Log the values we're extracting
+    _LOGGER.info("Validating device - Name: %s, Public Key: %s", device_name, public_key[:10])
+    
+    # If we get here, the connection was successful and we got valid info
+    return {"title": f"MeshCore Node {device_name}", "name": device_name, "pubkey": public_key}
+
+async def validate_common(api: MeshCoreAPI) -> Dict[str, Any]:
+    """Validate the user input allows us to connect to the device.
+
+    Transient transport failures are retried with exponential backoff and
+    jitter. Errors that point at wrong settings, such as a missing serial
+    path or a refused TCP port, fail on the first attempt.
+
+    Anything else takes all CONNECTION_ATTEMPTS attempts before failing. In
+    the worst case, such as a wrong BLE address that times out each time,
+    that is about 3 x CONNECTION_TIMEOUT plus backoff, roughly 35s with the
+    defaults, where a single attempt used to fail after about 10s.
+    """
+    try:
+        for attempt in range(CONNECTION_ATTEMPTS):
+            try:
+                return await _connect_and_get_info(api)
+            except RECOVERABLE_ERRORS as ex:
+                if _is_permanent_error(ex):
+                    raise CannotConnect(f"Failed to connect: {str(ex)}") from ex
+                if attempt == CONNECTION_ATTEMPTS - 1:
+                    if isinstance(ex, asyncio.TimeoutError):
+                        raise CannotConnect("Connection timed out") from ex
+                    # Report what connect() actually failed with, not our wrapper
+                    cause = api.last_error or ex
+                    raise CannotConnect(
+                        f"Failed to connect: {str(cause) or type(cause).__name__}"
+                    ) from ex
+
+                delay = min(
+                    CONNECTION_BACKOFF_MAX,
+                    CONNECTION_BACKOFF_BASE * 2 ** attempt * (1 + random.random() * 0.5),
+                )
+                _LOGGER.warning(
+                    "Connection attempt %d/%d failed (%s), retrying in %.1fs",
+                    attempt + 1, CONNECTION_ATTEMPTS, str(ex) or type(ex).__name__, delay,
+                )
+                # Start the next attempt from a clean connection
+                await api.disconnect()
+                await asyncio.sleep(delay)
+            except CannotConnect:
+                raise
+            except Exception as ex:
+                _LOGGER.error("Validation error: %s", ex)
+                raise CannotConnect(f"Failed to connect: {str(ex)}")
+
+        raise CannotConnect("Failed to connect")
+    finally:
+        # Always release the device, also when the flow is cancelled mid-validation
         await api.disconnect()
-        
-        # Extract and log the device information
-        device_name = node_info.payload.get('name', 'Unknown')
-        public_key = node_info.payload.get('public_key', '')
-        
-        # Log the values we're extracting
-        _LOGGER.info(f"Validating device - Name: {device_name}, Public Key: {public_key[:10]}")
-        
-        # If we get here, the connection was successful and we got valid info
-        return {"title": f"MeshCore Node {device_name}", "name": device_name, "pubkey": public_key}
-    except asyncio.TimeoutError:
-        raise CannotConnect("Connection timed out")
-    except Exception as ex:
-        _LOGGER.error("Validation error: %s", ex)
-        raise CannotConnect(f"Failed to connect: {str(ex)}")
 
 async def validate_usb_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate the user input allows us to connect to the USB device."""
@@ -142,6 +216,60 @@ async def validate_tcp_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[
     return await validate_common(api)
 
 
+async def _async_discover_ble_devices() -> Dict[str, str]:
+    """Scan for MeshCore BLE devices, returning address -> display name."""
+    devices: Dict[str, str] = {}
+
+    def _detection_callback(device, advertisement_data):
+        # Only keep MeshCore adverts, everything else is dropped here
+        if device.name and "MeshCore" in device.name:
+            devices[device.address] = f"{device.name} ({device.address})"
+
+    async with BleakScanner(detection_callback=_detection_callback):
+        await asyncio.sleep(BLE_SCAN_TIMEOUT)
+
+    return devices
+
+
+@callback
+def _async_get_ble_scan(hass: HomeAssistant) -> asyncio.Future:
+    """Return the in-flight or recent BLE scan, starting a new one if needed.
+
+    The scan is kept in hass.data so all config flows share it and concurrent
+    BLE steps don't compete for the radio. A completed scan is reused for
+    BLE_SCAN_CACHE_TTL.
+    """
+    state = hass.data.get(BLE_SCAN_DATA)
+    if state is not None:
+        return state["scan"]
+
+    scan = hass.async_create_background_task(
+        _async_discover_ble_devices(), "meshcore_ble_scan"
+    )
+    state = hass.data[BLE_SCAN_DATA] = {"scan": scan, "expire": None}
+
+    @callback
+    def _async_scan_done(task: asyncio.Future) -> None:
+        # Don't hold on to a failed scan, let the next caller retry
+        if task.cancelled() or task.exception():
+            _async_clear_ble_scan(hass)
+        else:
+            state["expire"] = hass.loop.call_later(
+                BLE_SCAN_CACHE_TTL, _async_clear_ble_scan, hass
+            )
+
+    scan.add_done_callback(_async_scan_done)
+    return scan
+
+
+@callback
+def _async_clear_ble_scan(hass: HomeAssistant) -> None:
+    """Forget the shared BLE scan and cancel its pending expiry."""
+    state = hass.data.pop(BLE_SCAN_DATA, None)
+    if state is not None and state["expire"] is not None:
+        state["expire"].cancel()
+
+
 class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ignore
     """Handle a config flow for MeshCore."""
 
@@ -201,10 +329,7 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
         # Skip trying to detect ports completely
         return self.async_show_form(
             step_id="usb", 
-            data_schema=vol.Schema({
-                vol.Required(CONF_USB_PATH): str,
-                vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): cv.positive_int,
-            }),
+            data_schema=USB_SCHEMA,
             errors=errors
         )
 
@@ -228,14 +353,16 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
 
-        # Scan for BLE devices
-        devices = {}
+        # Scan for BLE devices. A successful submit has already returned above,
+        # so we only get here when the form needs to be shown or redrawn.
+        scan = _async_get_ble_scan(self.hass)
+
+        devices: Dict[str, str] = {}
         try:
-            scanner = BleakScanner()
-            discovered_devices = await scanner.discover(timeout=5.0)
-            for device in discovered_devices:
-                if device.name and "MeshCore" in device.name:
-                    devices[device.address] = f"{device.name} ({device.address})"
+            # Shield the shared scan so our timeout doesn't cancel it for other flows
+            devices = await asyncio.wait_for(asyncio.shield(scan), timeout=BLE_SCAN_TIMEOUT + 1)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Timed out scanning for BLE devices")
         except Exception as ex:
             _LOGGER.warning("Failed to scan for BLE devices: %s", ex)
 
@@ -248,9 +375,7 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
             )
         else:
             # Otherwise, allow manual entry, but with simplified schema
-            schema = vol.Schema({
-                vol.Required(CONF_BLE_ADDRESS): str,
-            })
+            schema = BLE_SCHEMA
 
         return self.async_show_form(
             step_id="ble", data_schema=schema, errors=errors
@@ -279,10 +404,7 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
 
         return self.async_show_form(
             step_id="tcp", 
-            data_schema=vol.Schema({
-                vol.Required(CONF_TCP_HOST): str,
-                vol.Optional(CONF_TCP_PORT, default=DEFAULT_TCP_PORT): cv.port
-            }),
+            data_schema=TCP_SCHEMA,
             errors=errors
         )
 
@@ -306,27 +428,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 return await self.async_step_add_repeater()
                 
             elif action == "remove_repeater" and user_input.get("repeater_to_remove"):
-                # Remove the selected repeater
-                repeater_to_remove = user_input.get("repeater_to_remove")
-
-                # The repeater_to_remove has format: "Name (prefix)"
-                selected_str = repeater_to_remove
-                # Extract the pubkey from between parentheses
-                start = selected_str.rfind("(") + 1
-                end = selected_str.rfind(")")
-                pubkey_prefix_to_remove = selected_str[start:end]
+                # Remove the selected repeater, the dropdown value is its pubkey prefix
+                pubkey_prefix_to_remove = user_input.get("repeater_to_remove")
 
                 # Update the list without the removed repeater by comparing pubkey prefix
                 self.repeater_subscriptions = [
                     r for r in self.repeater_subscriptions
-                    if not (r.get("pubkey_prefix") and
-                           r.get("pubkey_prefix").startswith(pubkey_prefix_to_remove))
+                    if r.get("pubkey_prefix") != pubkey_prefix_to_remove
                 ]
                 
                 # Update the config entry data
-                new_data = dict(self.config_entry.data)
-                new_data[CONF_REPEATER_SUBSCRIPTIONS] = self.repeater_subscriptions
-                self.hass.config_entries.async_update_entry(self.config_entry, data=new_data) # type: ignore
+                self._async_save_repeater_subscriptions()
                 
                 # Return to the init step to show updated list
                 return await self.async_step_init()
@@ -346,33 +458,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             }),
         }
         
-        # If there are repeaters and the action is remove, add a selection dropdown
-        if self.repeater_subscriptions and "action" in schema:
-            # Create a dictionary for dropdown with pubkey_prefix as the value
-            repeater_entries = {}
-            for r in self.repeater_subscriptions:
-                name = r.get("name", "")
-                pubkey_prefix = r.get("pubkey_prefix", "")
-                if name and pubkey_prefix:
-                    # Display name includes pubkey prefix
-                    display_name = f"{name} ({pubkey_prefix})"
-                    # Value is the pubkey_prefix for unique identification
-                    repeater_entries[display_name] = display_name
-
-            if repeater_entries:
-                schema["repeater_to_remove"] = vol.In(repeater_entries)
-        
-        # Filter out None values, defaults, or empty strings
+        # Build the remove dropdown (keyed by pubkey_prefix) and the list of
+        # configured repeaters for the description in a single pass
+        repeater_entries = {}
         repeater_display_names = []
         for r in self.repeater_subscriptions:
             name = r.get("name")
             pubkey_prefix = r.get("pubkey_prefix", "")
-            if name and isinstance(name, str):
-                # Include prefix in display name if available
-                if pubkey_prefix:
-                    repeater_display_names.append(f"{name} ({pubkey_prefix})")
-                else:
-                    repeater_display_names.append(name)
+            if not name or not isinstance(name, str):
+                continue
+
+            # Include prefix in display name if available
+            display_name = f"{name} ({pubkey_prefix})" if pubkey_prefix else name
+            repeater_display_names.append(display_name)
+            if pubkey_prefix:
+                repeater_entries[pubkey_prefix] = display_name
+
+        if repeater_entries:
+            schema["repeater_to_remove"] = vol.In(repeater_entries)
 
         repeater_str = ", ".join(repeater_display_names) if repeater_display_names else "None configured"
 
@@ -385,22 +488,40 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         )
         
         
-    def _get_repeater_contacts(self):
-        """Get repeater contacts from coordinator's cached data."""
+    @callback
+    def _async_save_repeater_subscriptions(self) -> None:
+        """Store the repeater subscriptions on the config entry.
+
+        The entry's update listener reloads the integration in a background
+        task, so the options form can be redrawn without waiting for it.
+        """
+        # Store a copy so later edits to self.repeater_subscriptions don't mutate
+        # the entry data in place and hide the change from async_update_entry
+        new_data = {
+            **self.config_entry.data,
+            CONF_REPEATER_SUBSCRIPTIONS: list(self.repeater_subscriptions),
+        }
+        self.hass.config_entries.async_update_entry(self.config_entry, data=new_data) # type: ignore
+
+    def _get_repeater_contacts(self) -> Dict[str, Tuple[str, str]]:
+        """Get repeater contacts from coordinator's cached data.
+
+        Returns a dict of pubkey_prefix -> (name, display_name).
+        """
         # Get the coordinator
         if not self.hass or DOMAIN not in self.hass.data:
-            return []
+            return {}
 
         coordinator = self.hass.data[DOMAIN].get(self.config_entry.entry_id) # type: ignore
         if not coordinator:
-            return []
+            return {}
 
         # Get contacts from the _contacts attribute
-        repeater_contacts = []
+        repeater_contacts: Dict[str, Tuple[str, str]] = {}
 
         # Only proceed if _contacts attribute exists
         if not hasattr(coordinator, "_contacts"):
-            return []
+            return {}
 
         for contact in coordinator._contacts: # type: ignore
             if not isinstance(contact, dict):
@@ -413,13 +534,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             contact_type = contact.get("type")
 
             # Check for repeater (2) or room server (3) node types
-            if contact_type == NodeType.REPEATER or contact_type == NodeType.ROOM_SERVER:
+            if contact_type in _REPEATER_NODE_TYPES:
                 public_key = contact.get("public_key", "")
                 pubkey_prefix = public_key[:12] if public_key else ""
 
-                # Add tuple of (pubkey_prefix, name)
+                # Add (name, display_name) keyed by pubkey_prefix
                 if pubkey_prefix:
-                    repeater_contacts.append((pubkey_prefix, contact_name))
+                    repeater_contacts[pubkey_prefix] = (
+                        contact_name, f"{contact_name} ({pubkey_prefix})"
+                    )
 
         return repeater_contacts
         
@@ -439,7 +562,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         return self.async_show_form(
             step_id="add_repeater",
             data_schema=vol.Schema({
-                vol.Required(CONF_REPEATER_NAME): vol.In(repeater_dict.keys()),
+                vol.Required(CONF_REPEATER_NAME): vol.In({
+                    prefix: display_name for prefix, (_, display_name) in repeater_dict.items()
+                }),
                 vol.Optional(CONF_REPEATER_PASSWORD, default=default_password): str,
                 vol.Optional(CONF_REPEATER_UPDATE_INTERVAL, default=default_interval): int,
             }),
@@ -450,11 +575,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Handle adding a new repeater subscription."""
         errors = {}
         
-        # Get repeater contacts
-        repeater_contacts = self._get_repeater_contacts()
+        # Get repeater contacts as pubkey_prefix -> (name, display_name)
+        repeater_dict = self._get_repeater_contacts()
         
         # Show the form with repeater selection
-        if not repeater_contacts:
+        if not repeater_dict:
             # No repeaters found
             return self.async_show_form(
                 step_id="add_repeater",
@@ -464,12 +589,6 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 errors=errors,
             )
 
-        # Create a dictionary with name as key and (prefix, name) tuple as value
-        repeater_dict = {}
-        for prefix, name in repeater_contacts:
-            display_name = f"{name} ({prefix})"
-            repeater_dict[display_name] = (prefix, name)
-            
         if user_input is None:
             # First time showing form
             return self._show_add_repeater_form(repeater_dict)
@@ -478,62 +597,95 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         password = user_input.get(CONF_REPEATER_PASSWORD)
         update_interval = user_input.get(CONF_REPEATER_UPDATE_INTERVAL, DEFAULT_REPEATER_UPDATE_INTERVAL)
 
-        # The selected_repeater has format: "Name (prefix)"
-        selected_str = selected_repeater
-        # Extract the pubkey from between parentheses
-        start = selected_str.rfind("(") + 1
-        end = selected_str.rfind(")")
-        pubkey_prefix = selected_str[start:end]
-        # Extract name (everything before the open parenthesis)
-        repeater_name = selected_str[:start-1].strip()
+        # The selected_repeater is the pubkey prefix of the chosen contact
+        if selected_repeater not in repeater_dict:
+            errors["base"] = "Contact not found"
+            return self._show_add_repeater_form(repeater_dict, errors, user_input)
+        pubkey_prefix = selected_repeater
+        repeater_name = repeater_dict[pubkey_prefix][0]
 
         # Check if this repeater is already in the subscriptions by prefix
-        existing_prefixes = [r.get("pubkey_prefix") for r in self.repeater_subscriptions]
+        existing_prefixes = {
+            r.get("pubkey_prefix") for r in self.repeater_subscriptions if r.get("pubkey_prefix")
+        }
         if pubkey_prefix in existing_prefixes:
             errors["base"] = "Repeater is already configured"
             return self._show_add_repeater_form(repeater_dict, errors, user_input)
 
         coordinator = self.hass.data[DOMAIN].get(self.config_entry.entry_id) # type: ignore
-        meshcore = coordinator.api.mesh_core # type: ignore
+        mc = coordinator.api.mesh_core # type: ignore
 
         # validate the repeater can be logged into
-        contact = meshcore.get_contact_by_key_prefix(pubkey_prefix)
+        contact = mc.get_contact_by_key_prefix(pubkey_prefix)
         if not contact:
-            _LOGGER.error(f"Contact not found with public key prefix: {pubkey_prefix}")
+            _LOGGER.error("Contact not found with public key prefix: %s", pubkey_prefix)
             errors["base"] = "Contact not found"
             return self._show_add_repeater_form(repeater_dict, errors, user_input)
             
-        # Try to login
-        send_result = await meshcore.commands.send_login(contact, password)
-        
-        if send_result.type == EventType.ERROR:
-            error_message = send_result.payload
-            _LOGGER.error("Failed to login to repeater - received error: %s", error_message)
-            errors["base"] = "Failed to log in to repeater. Check password and try again."
-            return self._show_add_repeater_form(repeater_dict, errors, user_input)
-        
-        result = await meshcore.wait_for_event(EventType.LOGIN_SUCCESS, timeout=10)
+        # Listen for either login outcome before sending, so a rejected
+        # password returns right away instead of waiting out the timeout.
+        # Filter on this repeater, the coordinator logs into others on its own.
+        login_filter = { "pubkey_prefix": pubkey_prefix }
+        login_waits = [
+            asyncio.create_task(mc.wait_for_event(event_type, login_filter, timeout=10))
+            for event_type in (EventType.LOGIN_SUCCESS, EventType.LOGIN_FAILED)
+        ]
+        await asyncio.sleep(0)
+
+        try:
+            # Try to login
+            send_result = await mc.commands.send_login(contact, password)
+            
+            if send_result.type == EventType.ERROR:
+                error_message = send_result.payload
+                _LOGGER.error("Failed to login to repeater - received error: %s", error_message)
+                errors["base"] = "Failed to log in to repeater. Check password and try again."
+                return self._show_add_repeater_form(repeater_dict, errors, user_input)
+            
+            done, _ = await asyncio.wait(login_waits, return_when=asyncio.FIRST_COMPLETED)
+            # Both waits can finish together, one with the event and one timing
+            # out with None, so prefer whichever actually got an event
+            result = next((event for event in (task.result() for task in done) if event), None)
+        finally:
+            # Don't leave the other subscription waiting out its timeout
+            for task in login_waits:
+                if not task.done():
+                    task.cancel()
+
         if not result:
             _LOGGER.error("Timed out waiting for login success")
             errors["base"] = "Timed out waiting for login response"
             return self._show_add_repeater_form(repeater_dict, errors, user_input)
         
-        if result.type == EventType.ERROR:
-            error_message = result.payload if hasattr(result, 'payload') else "Unknown error"
-            _LOGGER.error("Failed to login to repeater - received error: %s", error_message)
+        if result.type == EventType.LOGIN_FAILED:
+            _LOGGER.error("Failed to login to repeater - received error: %s", result.payload)
             errors["base"] = "Failed to log in to repeater. Check password and try again."
             return self._show_add_repeater_form(repeater_dict, errors, user_input)
-            
-            
-        # Login successful, now optionally check for version
-        send_result = await meshcore.commands.send_cmd(contact, "ver")
-        
-        if send_result.type == EventType.ERROR:
-            _LOGGER.error("Failed to get repeater version - received error: %s", send_result.payload)
-            
+
+        # Login successful, now optionally check for version. This is best
+        # effort, the repeater is added with an unknown version if it fails.
+        # Start listening for the reply before sending so a fast response isn't missed.
         filter = { "pubkey_prefix": contact.get("public_key")[:12] }
+        ver_wait = asyncio.create_task(
+            mc.wait_for_event(EventType.CONTACT_MSG_RECV, filter, timeout=5)
+        )
+        # Yield once so the task gets to register its subscription
+        await asyncio.sleep(0)
+
+        msg = None
+        try:
+            send_result = await mc.commands.send_cmd(contact, "ver")
+            
+            if send_result.type == EventType.ERROR:
+                # No reply is coming, don't wait for one
+                ver_wait.cancel()
+                _LOGGER.error("Failed to get repeater version - received error: %s", send_result.payload)
+            else:
+                msg = await ver_wait
+        except Exception as ex:
+            ver_wait.cancel()
+            _LOGGER.warning("Error requesting repeater version: %s", ex)
 
-        msg = await meshcore.wait_for_event(EventType.CONTACT_MSG_RECV, filter, timeout=15)
         _LOGGER.debug("Received ver message: %s", msg)
         ver = "Unknown"
         if not msg or msg.type == EventType.ERROR:
@@ -553,9 +705,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         })
 
         # Update the config entry data
-        new_data = dict(self.config_entry.data)
-        new_data[CONF_REPEATER_SUBSCRIPTIONS] = self.repeater_subscriptions
-        self.hass.config_entries.async_update_entry(self.config_entry, data=new_data) # type: ignore
+        self._async_save_repeater_subscriptions()
 
         # Return to the init step
         return await self.async_step_init() # type: ignore
@@ -77,6 +77,11 @@ DEFAULT_UPDATE_TICK: Final = 5   # base polling interval
 
 # Other constants
 CONNECTION_TIMEOUT: Final = 10  # seconds
+CONNECTION_ATTEMPTS: Final = 3  # Connection attempts when validating a device
+CONNECTION_BACKOFF_BASE: Final = 1.0  # Initial retry delay in seconds, doubled per attempt
+CONNECTION_BACKOFF_MAX: Final = 30  # Maximum retry delay in seconds
+BLE_SCAN_TIMEOUT: Final = 2.0  # seconds
+BLE_SCAN_CACHE_TTL: Final = 10  # seconds to reuse a previous BLE scan
 
 class NodeType(IntEnum):
     CLIENT = 1
@@ -48,6 +48,7 @@ class MeshCoreAPI:
         self._connected = False
         self._connection = None
         self._mesh_core = None
+        self._last_error: Optional[Exception] = None
         self._node_info = {}
         self._cached_contacts = {}
         self._cached_messages = []
@@ -67,6 +68,11 @@ class MeshCoreAPI:
     def connected(self) -> bool:
         """Return whether the device is connected."""
         return self._connected
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Return the exception that made the last connect() fail, if any."""
+        return self._last_error
         
     async def connect(self) -> bool:
         """Connect to the MeshCore device using the appropriate connection type."""
@@ -74,6 +80,7 @@ class MeshCoreAPI:
             # Reset state first
             self._connected = False
             self._mesh_core = None
+            self._last_error = None
             
             _LOGGER.info("Connecting to MeshCore device...")
             
@@ -125,6 +132,7 @@ class MeshCoreAPI:
             
         except Exception as ex:
             _LOGGER.error("Error connecting to MeshCore device: %s", ex)
+            self._last_error = ex
             self._connected = False
             self._mesh_core = None
             return False